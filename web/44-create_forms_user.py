@@ -12,6 +12,13 @@ logging.getLogger("omero.gateway").setLevel(logging.ERROR)
 logging.getLogger("omero.client").setLevel(logging.ERROR)
 logging.getLogger("paramiko").setLevel(logging.ERROR)
 
+MAX_RETRY_DELAY = 5  # seconds
+
+
+def retry_delay(attempt):
+    """Exponential backoff (1s, 2s, 4s, ...) capped at MAX_RETRY_DELAY."""
+    return min(2 ** attempt, MAX_RETRY_DELAY)
+
 
 def create_forms_user(host, username, password, forms_user, forms_password, max_attempts=50):
     print("Waiting for OMERO server to be ready...")
@@ -22,7 +29,7 @@ def create_forms_user(host, username, password, forms_user, forms_password, max_
                 if attempt % 5 == 0:  # Only print every 5th attempt
                     print(
                         f"Server not ready, attempt {attempt + 1}/{max_attempts}")
-                time.sleep(5)  # Increased delay between attempts
+                time.sleep(retry_delay(attempt))
                 continue
 
             admin_serv = conn.getAdminService()
@@ -73,7 +80,7 @@ def create_forms_user(host, username, password, forms_user, forms_password, max_
             if 'conn' in locals():
                 conn.close()
 
-        time.sleep(2)
+        time.sleep(retry_delay(attempt))
     return False
 
 
@@ -226,36 +226,65 @@ var ScriptMenu = (function($) {
      * Fetches detailed script data for each directory.
      */
     function getScriptMenuData() {
-        if (Object.keys(scriptIds).length === 0) {
+        var directories = Object.keys(scriptIds);
+        if (directories.length === 0) {
             console.warn("No script IDs found. Skipping getScriptMenuData.");
             return;
         }
 
-        pendingDirectories = Object.keys(scriptIds).length;
-
-        Object.keys(scriptIds).forEach(function(directory) {
-            fetchScriptData(directory);
-        });
+        pendingDirectories = directories.length;
+        fetchScriptData(directories);
     }
 
     /**
-     * Fetches script data for a specific directory.
-     * @param {string} directory - The directory to fetch data for.
+     * Fetches script data for all directories in a single request and
+     * hands each directory its own share of the response.
+     * @param {Array} directories - The directories to fetch data for.
      */
-    function fetchScriptData(directory) {
+    function fetchScriptData(directories) {
+        var directoryById = {};
+        var allIds = [];
+        directories.forEach(function(directory) {
+            scriptIds[directory].forEach(function(id) {
+                directoryById[id] = directory;
+                allIds.push(id);
+            });
+        });
+
         $.ajax({
             url: '/scriptmenu/get_script_menu/',
             type: 'GET',
             data: { 
-                script_ids: scriptIds[directory].join(','),
-                directory: directory
+                script_ids: allIds.join(',')
             },
             success: function(response) {
-                handleScriptDataResponse(response, directory);
+                if (response.error_logs && response.error_logs.length > 0) {
+                    console.warn('Errors fetching script data:', response.error_logs);
+                }
+                if (!response.script_menu) {
+                    console.warn('No script_menu data in response');
+                    pendingDirectories = 0;
+                    return;
+                }
+                var scriptsByDirectory = {};
+                directories.forEach(function(directory) {
+                    scriptsByDirectory[directory] = [];
+                });
+                response.script_menu.forEach(function(script) {
+                    var directory = directoryById[script.id];
+                    if (!scriptsByDirectory[directory]) {
+                        console.warn('Unexpected script in response:', script.id);
+                        return;
+                    }
+                    scriptsByDirectory[directory].push(script);
+                });
+                directories.forEach(function(directory) {
+                    handleScriptDataResponse({ script_menu: scriptsByDirectory[directory] }, directory);
+                });
             },
             error: function(xhr, status, error) {
-                console.error('Error fetching script menu data for ' + directory + ':', error);
-                pendingDirectories--;
+                console.error('Error fetching script menu data:', error);
+                pendingDirectories = 0;
             }
         });
     }
@@ -1,17 +1,29 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from django.shortcuts import render
 from omeroweb.webclient.decorators import login_required, render_response
 from omero.rtypes import unwrap
 import logging
 from django.http import JsonResponse
-from omero.gateway import BlitzGateway
-from omero.api import IScriptPrx
-from omero.sys import Parameters
-from omero.model import OriginalFileI
+from omero.sys import ParametersI
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent getParams calls per request
+MAX_PARAMS_WORKERS = 8
+
+# Parsed script params keyed by (script id, file hash). Replacing a
+# script changes its hash, so cached entries never go stale.
+_PARAMS_CACHE = {}
+
+def _get_params(scriptService, script_id):
+    """Fetch the params of a script, or None if they cannot be parsed."""
+    try:
+        return scriptService.getParams(script_id)
+    except Exception as e:
+        logger.warning(f"Exception for script {script_id}: {str(e)}")
+        return None
+
 @login_required()
 @render_response()
 def webclient_templates(request, base_template, **kwargs):
@@ -28,25 +40,64 @@ def get_script_menu(request, conn=None, **kwargs):
     script_menu_data = []
     error_logs = []
 
-    scriptService = conn.getScriptService()
+    # Use the bare Ice proxy rather than conn.getScriptService(): Ice proxies
+    # are thread-safe, but BlitzGateway's ProxyObjectWrapper swaps shared
+    # state when it reconnects, so it must not be called from the workers
+    scriptService = conn.c.sf.getScriptService()
+
+    # Look up all script names and hashes in one projection instead of
+    # loading a full OriginalFile object per script
+    script_files = {}
+    if script_ids:
+        query_params = ParametersI()
+        query_params.addIds(script_ids)
+        try:
+            rows = conn.getQueryService().projection(
+                "select f.id, f.name, f.hash from OriginalFile f "
+                "where f.id in (:ids)",
+                query_params, conn.SERVICE_OPTS)
+            script_files = {file_id: (name, file_hash)
+                            for file_id, name, file_hash in unwrap(rows)}
+        except Exception as ex:
+            error_message = f"Error fetching script files {script_ids}: {str(ex)}"
+            logger.error(error_message)
+            error_logs.append(error_message)
+
+    all_params = {}
+    uncached_ids = []
+    for script_id, (_, file_hash) in script_files.items():
+        cached = _PARAMS_CACHE.get((script_id, file_hash))
+        if cached is None:
+            uncached_ids.append(script_id)
+        else:
+            all_params[script_id] = cached
+
+    if uncached_ids:
+        # getParams is one server round-trip per script, so issue them
+        # concurrently
+        workers = min(MAX_PARAMS_WORKERS, len(uncached_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = executor.map(
+                lambda script_id: _get_params(scriptService, script_id),
+                uncached_ids)
+            for script_id, params in zip(uncached_ids, fetched):
+                all_params[script_id] = params
+                file_hash = script_files[script_id][1]
+                if params is not None and file_hash is not None:
+                    _PARAMS_CACHE[(script_id, file_hash)] = params
 
     for script_id in script_ids:
         try:
-            script = conn.getObject("OriginalFile", script_id)
-            if script is None:
+            if script_id not in script_files:
                 error_logs.append(f"Script {script_id} not found")
                 continue
+            script_name = script_files[script_id][0]
 
-            try:
-                params = scriptService.getParams(script_id)
-            except Exception as e:
-                logger.warning(f"Exception for script {script_id}: {str(e)}")
-                params = None
-
+            params = all_params[script_id]
             if params is None:
                 script_data = {
                     'id': script_id,
-                    'name': script.name.replace("_", " "),
+                    'name': script_name.replace("_", " "),
                     'description': "No description available",
                     'authors': "Unknown",
                     'version': "Unknown",
@@ -33,9 +33,9 @@ $(document).ready(function() {
         updateSelectedItemsList();
     });
 
-    // Load directory contents
+    // Load directory contents, returns the request so callers can reuse the listing
     function loadDirectory(path, level = 0) {
-        $.getJSON('/databasepages/api/list_dir/', { path: path })
+        return $.getJSON('/databasepages/api/list_dir/', { path: path })
             .done(function(data) {
                 // Remove all columns after the current level
                 columnsDiv.children().slice(level).remove();
@@ -90,23 +90,25 @@ $(document).ready(function() {
     function handleDirectoryClick(item, path, level) {
         item.closest('.column').find('li').removeClass('active-directory');
         item.closest('li').addClass('active-directory');
-        loadDirectory(path, level + 1);
+        return loadDirectory(path, level + 1);
     }
 
     // Handle double-click on directory
     function handleDirectoryDoubleClick(item, path, level) {
-        handleDirectoryClick(item, path, level);
-        $.getJSON('/databasepages/api/list_dir/', { path: path })
+        // Reuse the listing fetched for the new column instead of requesting it twice
+        handleDirectoryClick(item, path, level)
             .done(function(data) {
                 if (data.error) {
                     alert(data.error);
                     return;
                 }
-                data.files.forEach(function(file) {
-                    const filePath = file.path;
+                const filePaths = data.files.map(function(file) {
+                    return file.path;
+                });
+                filePaths.forEach(function(filePath) {
                     selectedItems.add(filePath);
-                    fetchFileInfo(filePath);
                 });
+                fetchFilesInfo(filePaths);
                 const lastColumn = columnsDiv.children().last();
                 lastColumn.find('.file-name').each(function() {
                     const filePath = $(this).data('path');
@@ -137,6 +139,35 @@ $(document).ready(function() {
             });
     }
 
+    // Fetch file information for several files in a single request
+    function fetchFilesInfo(filePaths) {
+        if (filePaths.length === 0) {
+            return;
+        }
+        $.ajax({
+            url: '/databasepages/api/files_info/',
+            type: 'POST',
+            contentType: 'application/json',
+            headers: {
+                'X-CSRFToken': csrftoken
+            },
+            data: JSON.stringify({ paths: filePaths }),
+            success: function(data) {
+                const files = data.files || {};
+                filePaths.forEach(function(filePath) {
+                    selectedItemsInfo[filePath] = files[filePath] || { size: 'Unknown', modified: 'Unknown' };
+                });
+                updateSelectedItemsList();
+            },
+            error: function() {
+                filePaths.forEach(function(filePath) {
+                    selectedItemsInfo[filePath] = { size: 'Unknown', modified: 'Unknown' };
+                });
+                updateSelectedItemsList();
+            }
+        });
+    }
+
     // Update the selected items list
     function updateSelectedItemsList() {
         const selectedItemsSection = $('#selected-items-section');
@@ -2,12 +2,11 @@
 # -*- coding: utf-8 -*-
 from omeroweb.webclient.decorators import login_required, render_response
 import logging
-import jwt
+import json
 import time
 import os
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
-from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +20,22 @@ logger.info(f"   - Exists: {os.path.exists(BASE_DIR)}")
 logger.info(f"   - Readable: {os.access(BASE_DIR, os.R_OK) if os.path.exists(BASE_DIR) else 'N/A'}")
 logger.info(f"   - Executable: {os.access(BASE_DIR, os.X_OK) if os.path.exists(BASE_DIR) else 'N/A'}")
 
+def resolve_path(rel_path):
+    """Resolve a path relative to BASE_DIR, or None if it escapes BASE_DIR."""
+    abs_path = os.path.abspath(os.path.join(BASE_DIR, rel_path))
+    # A plain startswith would also accept siblings such as /L-Drive-other
+    if os.path.commonpath([abs_path, BASE_DIR]) != BASE_DIR:
+        return None
+    return abs_path
+
+def get_file_info(abs_file_path):
+    """Size and modification time of a file, from a single stat() call."""
+    stat = os.stat(abs_file_path)
+    return {
+        'size': f'{stat.st_size} bytes',
+        'modified': time.ctime(stat.st_mtime)
+    }
+
 def check_directory_access(path):
     """Check if a directory exists and is accessible."""
     try:
@@ -60,51 +75,47 @@ def server_side_browser(request, conn=None, **kwargs):
 @login_required()
 @require_http_methods(["GET"])
 def list_directory(request, conn=None, **kwargs):
-    logger.info("\n=== list_directory called ===")
-    logger.info(f"Request URL: {request.build_absolute_uri()}")
-    logger.info(f"Request path: {request.path}")
-    logger.info(f"Request GET params: {request.GET}")
-    
-    # Check access to L-Drive
-    can_access, message = check_directory_access(BASE_DIR)
-    if not can_access:
-        logger.error(f"L-Drive access check failed: {message}")
-        return JsonResponse({'error': message}, status=403)
+    # Per-request traces go to DEBUG with lazy formatting, so they cost
+    # nothing on the browse hot path unless debugging is enabled
+    logger.debug("=== list_directory called ===")
+    logger.debug("Request URL: %s", request.get_full_path())
+    logger.debug("Request GET params: %s", request.GET)
     
     current_path = request.GET.get('path', '')
-    abs_current_path = os.path.abspath(os.path.join(BASE_DIR, current_path))
-    
-    logger.info(f"Checking access to requested path: {abs_current_path}")
-    can_access, message = check_directory_access(abs_current_path)
-    if not can_access:
-        logger.error(f"Target directory access check failed: {message}")
-        return JsonResponse({'error': message}, status=403)
+    abs_current_path = resolve_path(current_path)
     
-    if not abs_current_path.startswith(BASE_DIR):
-        logger.warning(f"Access denied - path {abs_current_path} not within {BASE_DIR}")
+    if abs_current_path is None:
+        logger.warning(f"Access denied - path {current_path} not within {BASE_DIR}")
         return JsonResponse({'error': 'Access denied - path outside of allowed directory'}, status=403)
 
     try:
-        items = os.listdir(abs_current_path)
-        logger.info(f"Successfully listed directory: {abs_current_path}")
-        logger.info(f"Found {len(items)} items")
-        
         dirs = []
         files = []
-        for item in items:
-            item_path = os.path.join(abs_current_path, item)
-            rel_item_path = os.path.relpath(item_path, BASE_DIR)
-            if os.path.isdir(item_path):
-                dirs.append({'name': item, 'path': rel_item_path})
-            else:
-                files.append({'name': item, 'path': rel_item_path})
+        # scandir reuses the entry type from the directory read, so we
+        # avoid an extra stat() per item compared to listdir + isdir
+        with os.scandir(abs_current_path) as entries:
+            for entry in entries:
+                rel_item_path = os.path.relpath(entry.path, BASE_DIR)
+                if entry.is_dir():
+                    dirs.append({'name': entry.name, 'path': rel_item_path})
+                else:
+                    files.append({'name': entry.name, 'path': rel_item_path})
+        logger.debug("Listed directory %s: %d items",
+                     abs_current_path, len(dirs) + len(files))
 
         return JsonResponse({
             'current_path': current_path,
             'dirs': dirs,
             'files': files
         })
-    except OSError as e:
+    except (OSError, ValueError) as e:
+        # Only diagnose access on failure, the happy path is a single scandir.
+        # ValueError covers paths scandir rejects outright (e.g. NUL bytes).
+        for path, label in ((BASE_DIR, "L-Drive"), (abs_current_path, "Target directory")):
+            can_access, message = check_directory_access(path)
+            if not can_access:
+                logger.error(f"{label} access check failed: {message}")
+                return JsonResponse({'error': message}, status=403)
         logger.error(f"Failed to list directory {abs_current_path}: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -112,26 +123,47 @@ def list_directory(request, conn=None, **kwargs):
 @require_http_methods(["GET"])
 def file_info(request, conn=None, **kwargs):
     file_path = request.GET.get('path', '')
-    abs_file_path = os.path.abspath(os.path.join(BASE_DIR, file_path))
+    abs_file_path = resolve_path(file_path)
 
-    if not abs_file_path.startswith(BASE_DIR):
+    if abs_file_path is None:
         return JsonResponse({'error': 'Access denied'}, status=403)
 
     try:
-        size = os.path.getsize(abs_file_path)
-        modified_time = time.ctime(os.path.getmtime(abs_file_path))
-        return JsonResponse({
-            'size': f'{size} bytes',
-            'modified': modified_time
-        })
+        return JsonResponse(get_file_info(abs_file_path))
     except OSError as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+@login_required()
+@require_http_methods(["POST"])
+def files_info(request, conn=None, **kwargs):
+    """Return size and modification time of several files in one request."""
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+
+    file_paths = data.get('paths', []) if isinstance(data, dict) else None
+    if not isinstance(file_paths, list) or \
+            not all(isinstance(path, str) for path in file_paths):
+        return JsonResponse({'error': "'paths' must be a list of strings"}, status=400)
+
+    info = {}
+    for file_path in file_paths:
+        abs_file_path = resolve_path(file_path)
+        if abs_file_path is None:
+            return JsonResponse({'error': 'Access denied'}, status=403)
+        try:
+            info[file_path] = get_file_info(abs_file_path)
+        except (OSError, ValueError) as e:
+            # Leave it out, the client shows unknown details for it
+            logger.warning(f"Failed to get file info for {abs_file_path}: {str(e)}")
+
+    return JsonResponse({'files': info})
+
 @login_required()
 @require_http_methods(["POST"])
 def import_selected(request, conn=None, **kwargs):
     try:
-        import json
         data = json.loads(request.body)
         selected_items = data.get('selected', [])
         
@@ -147,8 +179,8 @@ def import_selected(request, conn=None, **kwargs):
         logger.info(f"User {username} (ID: {user_id}) attempting to import {len(selected_items)} items")
         
         for item in selected_items:
-            abs_path = os.path.abspath(os.path.join(BASE_DIR, item))
-            if not abs_path.startswith(BASE_DIR):
+            abs_path = resolve_path(item)
+            if abs_path is None:
                 return JsonResponse({'error': 'Access denied'}, status=403)
             logger.info(f"Importing: {abs_path}")
             # Add your actual import logic here
@@ -2,7 +2,9 @@ import os
 import sys
 
 def update_login_html(image_directory, html_file, destination_file):
-    image_files = [f for f in os.listdir(image_directory) if os.path.isfile(os.path.join(image_directory, f))]
+    # scandir caches the entry type, avoiding a stat() per directory entry
+    with os.scandir(image_directory) as entries:
+        image_files = [entry.name for entry in entries if entry.is_file()]
     # Generate a JavaScript array of image paths
     image_paths = ['"{{% static \'webclient/image/institution_banner/{}\' %}}"'.format(f) for f in image_files]
     image_array = 'var images = [{}];'.format(', '.join(image_paths))